@@ -4,23 +4,176 @@ Jellyfin Catalog Generator
 Creates PDF documentation from Jellyfin NFO files and images
 """
 
-import xml.etree.ElementTree as ET
+import functools
+import os
+import re
+import sys
+
+# lxml (libxml2) parses NFOs roughly an order of magnitude faster than the
+# stdlib parser and exposes the same find/findall API; fall back silently
+# when it isn't installed
+try:
+    from lxml import etree as ET
+    _ParseError = ET.XMLSyntaxError
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _ParseError = ET.ParseError
+
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from PIL import Image
 import argparse
 
+# Matches "Season 01", "Season 1" etc. - compiled once, used per directory
+_SEASON_NUM_RE = re.compile(r'season\s*(\d+)', re.IGNORECASE)
+
+# Episode NFOs named like "S01E01.nfo" / "s1e1 - Pilot.nfo"
+_EPISODE_NAME_RE = re.compile(r'^s\d{1,3}e\d{1,3}.*\.nfo$', re.IGNORECASE)
+
+# Movie NFOs named after the media file, e.g. "The Matrix (1999).nfo"
+_MOVIE_HINT_RE = re.compile(r'\((19|20)\d{2}\)\.nfo$')
+
+# Language code -> readable name; codes repeat constantly across a library
+_LANGUAGE_MAP = {
+    'ger': 'German',
+    'deu': 'German',
+    'de': 'German',
+    'eng': 'English',
+    'en': 'English',
+    'fra': 'French',
+    'fre': 'French',
+    'fr': 'French',
+    'spa': 'Spanish',
+    'es': 'Spanish',
+    'ita': 'Italian',
+    'it': 'Italian',
+    'jpn': 'Japanese',
+    'ja': 'Japanese',
+    'rus': 'Russian',
+    'ru': 'Russian',
+    'chi': 'Chinese',
+    'zh': 'Chinese',
+    'por': 'Portuguese',
+    'pt': 'Portuguese',
+    'pol': 'Polish',
+    'pl': 'Polish',
+    'tur': 'Turkish',
+    'tr': 'Turkish',
+    'ara': 'Arabic',
+    'ar': 'Arabic',
+}
+
+
+def _walk_nfo(base: str):
+    """Yields (path, name) for every .nfo file below base.
+
+    Hand-rolled os.scandir walk - unlike Path.rglob it allocates no Path
+    object per visited entry, which matters on libraries with thousands
+    of media files per NFO.
+    """
+    stack = [base]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith('.nfo'):
+                    yield entry.path, entry.name
+
+
+# Top-level tags worth keeping when parsing an NFO
+_FIELD_TAGS = frozenset(('title', 'year', 'plot', 'outline', 'overview'))
+
+
+class _NFOTarget:
+    """Streaming parse target that keeps only catalog-relevant fields.
+
+    NFOs routinely carry large <actor>/<thumb> subtrees that the catalog
+    never looks at; a full ET.parse allocates an Element for every one of
+    them. This target collects the half-dozen interesting fields directly
+    from the expat callbacks without building a tree at all.
+    """
+    __slots__ = ('root_tag', 'fields', 'audio_streams', 'subtitle_langs',
+                 '_stack', '_stream', '_stream_kind', '_capture')
+
+    def __init__(self):
+        self.root_tag = None
+        self.fields = {}          # title/year/plot/outline/overview
+        self.audio_streams = []   # one {language, codec, channels} per <audio>
+        self.subtitle_langs = []  # one language string per <subtitle>
+        self._stack = []
+        self._stream = None
+        self._stream_kind = None
+        self._capture = None
+
+    def start(self, tag, attrs):
+        stack = self._stack
+        depth = len(stack)
+        if depth == 0:
+            self.root_tag = tag
+        elif depth == 1:
+            if tag in _FIELD_TAGS and tag not in self.fields:
+                self._capture = []
+        elif depth == 3 and stack[1] == 'fileinfo' and stack[2] == 'streamdetails':
+            if tag == 'audio' or tag == 'subtitle':
+                self._stream = {}
+                self._stream_kind = tag
+        elif self._stream is not None and depth == 4 and tag in ('language', 'codec', 'channels'):
+            self._capture = []
+        stack.append(tag)
+
+    def data(self, text):
+        if self._capture is not None:
+            self._capture.append(text)
+
+    def end(self, tag):
+        stack = self._stack
+        stack.pop()
+        depth = len(stack)
+        capture = self._capture
+        if capture is not None:
+            # Flush only when the captured element itself closes; a child
+            # element ending inside it (markup like <b> in <plot>) keeps
+            # the capture open so the trailing text is still collected
+            if depth == 1 and tag in _FIELD_TAGS:
+                self._capture = None
+                text = ''.join(capture).strip()
+                if text:
+                    self.fields[tag] = text
+            elif depth == 4 and self._stream is not None:
+                self._capture = None
+                text = ''.join(capture).strip()
+                if text:
+                    self._stream[tag] = text
+        elif self._stream is not None and depth == 3:
+            # Closing </audio> or </subtitle> - flush the stream
+            if self._stream_kind == 'audio':
+                self.audio_streams.append(self._stream)
+            else:
+                self.subtitle_langs.append(self._stream.get('language'))
+            self._stream = None
+
+    def close(self):
+        return self
+
 
-@dataclass
+@dataclass(slots=True)
 class Season:
     """Represents a season of a TV show"""
     season_number: int
     episode_count: int
     poster_path: Optional[Path]
+    directory: Optional[Path] = None  # Season directory, reused for episode lookups
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaItem:
     """Represents a media item (movie or TV show)"""
     title: str
@@ -29,9 +182,10 @@ class MediaItem:
     media_type: str  # 'movie' or 'tvshow'
     poster_path: Optional[Path]
     nfo_path: Path
-    audio_tracks: List[str]  # List of audio tracks (e.g., "German", "English")
-    subtitle_tracks: List[str]  # List of subtitles (e.g., "German", "English")
+    audio_tracks: Tuple[str, ...] = ()  # Audio tracks (e.g., "German", "English")
+    subtitle_tracks: Tuple[str, ...] = ()  # Subtitles (e.g., "German", "English")
     seasons: Optional[List[Season]] = None  # Only for TV shows: list of seasons
+    _sort_key: Optional[str] = None  # Cached by CatalogSorter, computed on first sort
     
     def __repr__(self):
         if self.media_type == 'tvshow' and self.seasons:
@@ -44,75 +198,129 @@ class JellyfinScanner:
     
     def __init__(self, base_path: Path):
         self.base_path = Path(base_path)
-        self.items: List[MediaItem] = []
+        # Parsed field sets keyed by path, so a file probed during
+        # classification isn't parsed again when its item is built
+        self._nfo_cache: Dict[str, _NFOTarget] = {}
+        # Parse failures, reported once at end of scan - per-file prints
+        # would serialize the worker threads on the stdout lock
+        self._errors: List[str] = []
     
-    def scan(self) -> List[MediaItem]:
-        """Scans all NFO files in the base directory"""
+    def scan(self):
+        """Scans all NFO files in the base directory, yielding MediaItems.
+        
+        Generator so the caller owns the only list of items - the scanner
+        doesn't keep a second full copy alive alongside the sorted one.
+        """
         print(f"Scanning directory: {self.base_path}")
         
         # Find all NFO files
-        nfo_files = list(self.base_path.rglob("*.nfo"))
-        print(f"Found: {len(nfo_files)} NFO files")
+        nfo_entries = list(_walk_nfo(str(self.base_path)))
+        print(f"Found: {len(nfo_entries)} NFO files")
         
         # Separate movies and TV show NFOs
         tvshow_nfos = []
         movie_nfos = []
         episode_nfos = []
-        
-        for nfo_file in nfo_files:
-            filename = nfo_file.name.lower()
-            if filename == 'tvshow.nfo':
-                tvshow_nfos.append(nfo_file)
-            elif filename.startswith('s') and filename.endswith('.nfo'):
-                # Episode NFOs (e.g., S01E01.nfo) - skip
-                episode_nfos.append(nfo_file)
-            else:
-                # Check root tag for movies
-                try:
-                    tree = ET.parse(nfo_file)
-                    root = tree.getroot()
-                    if root.tag == 'movie':
-                        movie_nfos.append(nfo_file)
-                    elif root.tag == 'episodedetails':
-                        episode_nfos.append(nfo_file)
-                except:
-                    pass
-        
-        print(f"  - {len(movie_nfos)} movie NFOs")
-        print(f"  - {len(tvshow_nfos)} TV show NFOs")
-        print(f"  - {len(episode_nfos)} episode NFOs (will be skipped)")
-        
-        # Parse movies
-        for nfo_file in movie_nfos:
-            item = self._parse_nfo(nfo_file)
-            if item:
-                self.items.append(item)
-        
-        # Parse TV shows with season information
-        for nfo_file in tvshow_nfos:
-            item = self._parse_tvshow_with_seasons(nfo_file)
-            if item:
-                self.items.append(item)
-        
-        print(f"Successfully parsed: {len(self.items)} items")
-        return self.items
+
+        # Classification and parsing run on a thread pool: the expat parser
+        # releases the GIL, so threads overlap both disk reads and XML work
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+            kinds = executor.map(self._classify, nfo_entries, chunksize=32)
+            for (path, name), kind in zip(nfo_entries, kinds):
+                if kind == 'tvshow':
+                    # Only the few files actually parsed get a Path object
+                    tvshow_nfos.append(Path(path))
+                elif kind == 'movie':
+                    movie_nfos.append(Path(path))
+                elif kind == 'episode':
+                    episode_nfos.append(path)
+
+            print(f"  - {len(movie_nfos)} movie NFOs")
+            print(f"  - {len(tvshow_nfos)} TV show NFOs")
+            print(f"  - {len(episode_nfos)} episode NFOs (will be skipped)")
+
+            parsed = 0
+
+            # Parse movies
+            for item in executor.map(self._parse_nfo, movie_nfos):
+                if item:
+                    parsed += 1
+                    yield item
+
+            # Parse TV shows with season information
+            for item in executor.map(self._parse_tvshow_with_seasons, tvshow_nfos):
+                if item:
+                    parsed += 1
+                    yield item
+
+        # Parsed fields are only useful within one scan - let them go
+        self._nfo_cache.clear()
+
+        if self._errors:
+            print(f"Failed to parse {len(self._errors)} files:")
+            for error in self._errors[:5]:
+                print(f"  {error}")
+            if len(self._errors) > 5:
+                print(f"  ... and {len(self._errors) - 5} more")
+
+        print(f"Successfully parsed: {parsed} items")
+
+    def _classify(self, entry) -> Optional[str]:
+        """Classifies a (path, name) NFO entry as 'tvshow', 'movie' or 'episode'"""
+        path, name = entry
+        filename = name.lower()
+        if filename == 'tvshow.nfo':
+            return 'tvshow'
+        if filename == 'movie.nfo':
+            return 'movie'
+        if _EPISODE_NAME_RE.match(filename):
+            # Episode NFOs (e.g., S01E01.nfo) - skip. A full SxxExx match,
+            # so "spiderman.nfo" no longer counts as an episode
+            return 'episode'
+        if _MOVIE_HINT_RE.search(filename):
+            # "Title (1999).nfo" - named after the media file
+            return 'movie'
+
+        # Filename gives no hint - check the root tag. The ambiguous files
+        # reaching this point are mostly movies whose fields are needed
+        # right after, so parse once here and let _parse_nfo reuse the cache
+        try:
+            tag = self._get_nfo(path).root_tag
+            if tag == 'movie':
+                return 'movie'
+            elif tag == 'episodedetails':
+                return 'episode'
+        except:
+            pass
+        return None
+
+    def _get_nfo(self, nfo_path) -> _NFOTarget:
+        """Parses an NFO file, reusing a previously parsed result if cached"""
+        key = str(nfo_path)
+        nfo = self._nfo_cache.get(key)
+        if nfo is None:
+            parser = ET.XMLParser(target=_NFOTarget())
+            with open(nfo_path, 'rb') as f:
+                parser.feed(f.read())
+            nfo = parser.close()
+            self._nfo_cache[key] = nfo
+        return nfo
     
     def _parse_tvshow_with_seasons(self, nfo_path: Path) -> Optional[MediaItem]:
         """Parses a TV show NFO and collects season information"""
         try:
-            tree = ET.parse(nfo_path)
-            root = tree.getroot()
+            nfo = self._get_nfo(nfo_path)
+            fields = nfo.fields
             
             # Extract TV show information
-            title = self._get_text(root, 'title')
-            year = self._get_text(root, 'year')
-            description = (self._get_text(root, 'plot') or 
-                          self._get_text(root, 'outline') or
-                          self._get_text(root, 'overview'))
+            title = fields.get('title')
+            year = fields.get('year')
+            description = (fields.get('plot') or
+                          fields.get('outline') or
+                          fields.get('overview'))
             
             # Audio/subtitles from first episode of a season
-            audio_tracks = self._extract_audio_tracks(root)
-            subtitle_tracks = self._extract_subtitle_tracks(root)
+            audio_tracks, subtitle_tracks = self._extract_streams(nfo)
             
             # Search for poster in same directory
             poster_path = self._find_poster(nfo_path.parent)
@@ -122,17 +330,21 @@ class JellyfinScanner:
             
             # If no audio/subtitles in tvshow.nfo, get them from first episode
             if not audio_tracks and not subtitle_tracks and seasons:
-                season_dir = nfo_path.parent / f"Season {seasons[0].season_number:02d}"
-                if not season_dir.exists():
-                    season_dir = nfo_path.parent / f"Season {seasons[0].season_number}"
-                if season_dir.exists():
-                    episode_nfos = list(season_dir.glob("*.nfo"))
-                    if episode_nfos:
+                # _collect_season_info already found the directory - no need
+                # to probe "Season NN" and "Season N" spellings again
+                season_dir = seasons[0].directory
+                if season_dir is not None:
+                    # Only one episode is read - stop at the first match
+                    # instead of globbing every NFO name in the season
+                    episode_nfo = next(
+                        (p for p in season_dir.iterdir()
+                         if p.suffix.lower() == '.nfo'
+                         and not p.name.lower().startswith('season')),
+                        None)
+                    if episode_nfo is not None:
                         try:
-                            ep_tree = ET.parse(episode_nfos[0])
-                            ep_root = ep_tree.getroot()
-                            audio_tracks = self._extract_audio_tracks(ep_root)
-                            subtitle_tracks = self._extract_subtitle_tracks(ep_root)
+                            ep_nfo = self._get_nfo(episode_nfo)
+                            audio_tracks, subtitle_tracks = self._extract_streams(ep_nfo)
                         except:
                             pass
             
@@ -149,7 +361,7 @@ class JellyfinScanner:
             )
             
         except Exception as e:
-            print(f"Error parsing TV show {nfo_path}: {e}")
+            self._errors.append(f"{nfo_path}: {e}")
             return None
     
     def _collect_season_info(self, show_dir: Path) -> List[Season]:
@@ -163,18 +375,11 @@ class JellyfinScanner:
                 season_dirs.append(item)
         
         for season_dir in sorted(season_dirs):
-            # Extract season number
-            season_name = season_dir.name.lower()
-            season_num = None
-            
-            # Try to extract number (e.g., "Season 01", "Season 1")
-            import re
-            match = re.search(r'season\s*(\d+)', season_name)
-            if match:
-                season_num = int(match.group(1))
-            
-            if season_num is None:
+            # Extract season number (e.g., "Season 01", "Season 1")
+            match = _SEASON_NUM_RE.search(season_dir.name)
+            if match is None:
                 continue
+            season_num = int(match.group(1))
             
             # Count episode NFOs in this season
             episode_nfos = [f for f in season_dir.glob("*.nfo") 
@@ -187,72 +392,101 @@ class JellyfinScanner:
             seasons.append(Season(
                 season_number=season_num,
                 episode_count=episode_count,
-                poster_path=season_poster
+                poster_path=season_poster,
+                directory=season_dir
             ))
         
         return sorted(seasons, key=lambda s: s.season_number)
     
+    # Image extensions accepted as poster fallback, in priority order
+    IMAGE_EXTS = ('.jpg', '.jpeg', '.png')
+
+    def _scan_images(self, directory: Path, wanted) -> tuple:
+        """Reads a directory once, recording wanted names and a fallback image.
+
+        One scandir call replaces an exists() stat per candidate name plus
+        a glob per extension. Matching is done on lowercased names so
+        "Poster.JPG" on a case-sensitive filesystem is still found.
+        Returns (found names dict, fallback image).
+        """
+        found = {}
+        first_by_ext = {}
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return found, None
+
+        with entries:
+            for entry in entries:
+                name = entry.name.lower()
+                if name in wanted:
+                    found[name] = Path(entry.path)
+                else:
+                    for ext in self.IMAGE_EXTS:
+                        if name.endswith(ext) and ext not in first_by_ext:
+                            first_by_ext[ext] = Path(entry.path)
+                            break
+
+        for ext in self.IMAGE_EXTS:
+            if ext in first_by_ext:
+                return found, first_by_ext[ext]
+        return found, None
+
     def _find_season_poster(self, season_dir: Path, season_num: int, show_dir: Path) -> Optional[Path]:
         """Searches for season poster in multiple locations"""
         # Priority 1: season01-poster files in show main directory (Jellyfin standard)
-        show_poster_names = [
+        show_poster_names = (
             f'season{season_num:02d}-poster.jpg',
             f'season{season_num:02d}-poster.png',
             f'season{season_num}-poster.jpg',
             f'season{season_num}-poster.png',
             f'season-{season_num:02d}-poster.jpg',
             f'season-{season_num:02d}-poster.png',
-        ]
-        
+        )
+
+        found, _ = self._scan_images(show_dir, show_poster_names)
         for name in show_poster_names:
-            poster = show_dir / name
-            if poster.exists():
-                return poster
-        
+            if name in found:
+                return found[name]
+
         # Priority 2: Poster files in season directory
-        season_poster_names = [
+        season_poster_names = (
             'poster.jpg',
             'poster.png',
             'folder.jpg',
             'folder.png',
             f'season{season_num:02d}-poster.jpg',
             f'season{season_num:02d}-poster.png',
-        ]
-        
+        )
+
+        found, first_image = self._scan_images(season_dir, season_poster_names)
         for name in season_poster_names:
-            poster = season_dir / name
-            if poster.exists():
-                return poster
-        
+            if name in found:
+                return found[name]
+
         # Fallback: First image in directory
-        for ext in ['.jpg', '.jpeg', '.png']:
-            images = list(season_dir.glob(f'*{ext}'))
-            if images:
-                return images[0]
-        
-        return None
+        return first_image
     
     def _parse_nfo(self, nfo_path: Path) -> Optional[MediaItem]:
         """Parses a single NFO file"""
         try:
-            tree = ET.parse(nfo_path)
-            root = tree.getroot()
+            nfo = self._get_nfo(nfo_path)
+            fields = nfo.fields
             
             # Determine media type based on root tag
-            media_type = root.tag  # 'movie' or 'tvshow'
+            media_type = nfo.root_tag  # 'movie' or 'tvshow'
             
             # Extract information
-            title = self._get_text(root, 'title')
-            year = self._get_text(root, 'year')
+            title = fields.get('title')
+            year = fields.get('year')
             
             # Description can be in different tags
-            description = (self._get_text(root, 'plot') or 
-                          self._get_text(root, 'outline') or
-                          self._get_text(root, 'overview'))
+            description = (fields.get('plot') or
+                          fields.get('outline') or
+                          fields.get('overview'))
             
             # Extract audio and subtitle information
-            audio_tracks = self._extract_audio_tracks(root)
-            subtitle_tracks = self._extract_subtitle_tracks(root)
+            audio_tracks, subtitle_tracks = self._extract_streams(nfo)
             
             # Search for poster in same directory
             poster_path = self._find_poster(nfo_path.parent)
@@ -268,123 +502,67 @@ class JellyfinScanner:
                 subtitle_tracks=subtitle_tracks
             )
             
-        except ET.ParseError as e:
-            print(f"Error parsing {nfo_path}: {e}")
+        except _ParseError as e:
+            self._errors.append(f"{nfo_path}: {e}")
             return None
         except Exception as e:
-            print(f"Unexpected error at {nfo_path}: {e}")
+            self._errors.append(f"{nfo_path}: unexpected error: {e}")
             return None
     
-    def _get_text(self, root: ET.Element, tag: str) -> Optional[str]:
-        """Extracts text from an XML tag"""
-        element = root.find(tag)
-        return element.text.strip() if element is not None and element.text else None
-    
-    def _extract_audio_tracks(self, root: ET.Element) -> List[str]:
-        """Extracts audio tracks from NFO file"""
+    def _extract_streams(self, nfo: _NFOTarget) -> tuple:
+        """Builds audio and subtitle track descriptions from a parsed NFO"""
         audio_tracks = []
-        
-        # Jellyfin/Kodi NFO format: <fileinfo><streamdetails><audio>
-        fileinfo = root.find('fileinfo')
-        if fileinfo is not None:
-            streamdetails = fileinfo.find('streamdetails')
-            if streamdetails is not None:
-                for audio in streamdetails.findall('audio'):
-                    language = audio.find('language')
-                    codec = audio.find('codec')
-                    channels = audio.find('channels')
-                    
-                    # Build audio info
-                    parts = []
-                    if language is not None and language.text:
-                        lang = language.text.strip()
-                        # Convert language codes
-                        lang = self._convert_language_code(lang)
-                        parts.append(lang)
-                    if codec is not None and codec.text:
-                        parts.append(codec.text.strip().upper())
-                    if channels is not None and channels.text:
-                        ch = channels.text.strip()
-                        if ch:
-                            parts.append(f"{ch}ch")
-                    
-                    if parts:
-                        audio_tracks.append(" ".join(parts))
-        
-        return audio_tracks
-    
-    def _extract_subtitle_tracks(self, root: ET.Element) -> List[str]:
-        """Extracts subtitles from NFO file"""
         subtitle_tracks = []
         
-        # Jellyfin/Kodi NFO format: <fileinfo><streamdetails><subtitle>
-        fileinfo = root.find('fileinfo')
-        if fileinfo is not None:
-            streamdetails = fileinfo.find('streamdetails')
-            if streamdetails is not None:
-                for subtitle in streamdetails.findall('subtitle'):
-                    language = subtitle.find('language')
-                    if language is not None and language.text:
-                        lang = language.text.strip()
-                        # Convert language codes
-                        lang = self._convert_language_code(lang)
-                        if lang not in subtitle_tracks:  # Avoid duplicates
-                            subtitle_tracks.append(lang)
+        for stream in nfo.audio_streams:
+            # Build audio info
+            parts = []
+            language = stream.get('language')
+            if language:
+                # Convert language codes
+                parts.append(self._convert_language_code(language))
+            codec = stream.get('codec')
+            if codec:
+                parts.append(codec.upper())
+            channels = stream.get('channels')
+            if channels:
+                parts.append(f"{channels}ch")
+            
+            if parts:
+                # Libraries repeat a handful of descriptors like
+                # "German DTS 6ch" thousands of times - intern to share them
+                audio_tracks.append(sys.intern(" ".join(parts)))
+        
+        for language in nfo.subtitle_langs:
+            if language:
+                # Convert language codes
+                lang = self._convert_language_code(language)
+                if lang not in subtitle_tracks:  # Avoid duplicates
+                    subtitle_tracks.append(lang)
         
-        return subtitle_tracks
+        return tuple(audio_tracks), tuple(subtitle_tracks)
     
-    def _convert_language_code(self, code: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _convert_language_code(code: str) -> str:
         """Converts language codes to readable names"""
-        language_map = {
-            'ger': 'German',
-            'deu': 'German',
-            'de': 'German',
-            'eng': 'English',
-            'en': 'English',
-            'fra': 'French',
-            'fre': 'French',
-            'fr': 'French',
-            'spa': 'Spanish',
-            'es': 'Spanish',
-            'ita': 'Italian',
-            'it': 'Italian',
-            'jpn': 'Japanese',
-            'ja': 'Japanese',
-            'rus': 'Russian',
-            'ru': 'Russian',
-            'chi': 'Chinese',
-            'zh': 'Chinese',
-            'por': 'Portuguese',
-            'pt': 'Portuguese',
-            'pol': 'Polish',
-            'pl': 'Polish',
-            'tur': 'Turkish',
-            'tr': 'Turkish',
-            'ara': 'Arabic',
-            'ar': 'Arabic',
-        }
-        
-        code_lower = code.lower()
-        return language_map.get(code_lower, code.capitalize())
+        # or-short-circuit: capitalize() only runs for unknown codes, and
+        # interning the result collapses repeats of the same unknown code
+        return _LANGUAGE_MAP.get(code.lower()) or sys.intern(code.capitalize())
     
     def _find_poster(self, directory: Path) -> Optional[Path]:
         """Searches for poster images in directory"""
         # Typical Jellyfin poster names
-        poster_names = ['poster.jpg', 'poster.png', 'folder.jpg', 'folder.png', 
-                       'cover.jpg', 'cover.png']
-        
+        poster_names = ('poster.jpg', 'poster.png', 'folder.jpg', 'folder.png',
+                        'cover.jpg', 'cover.png')
+
+        found, first_image = self._scan_images(directory, poster_names)
         for name in poster_names:
-            poster = directory / name
-            if poster.exists():
-                return poster
-        
+            if name in found:
+                return found[name]
+
         # Fallback: First image in directory
-        for ext in ['.jpg', '.jpeg', '.png']:
-            images = list(directory.glob(f'*{ext}'))
-            if images:
-                return images[0]
-        
-        return None
+        return first_image
 
 
 class CatalogSorter:
@@ -411,40 +589,55 @@ class CatalogSorter:
         if not title:
             return ""
         
-        # Convert to lowercase
-        title_lower = title.lower().strip()
-        
-        # Split into words
-        words = title_lower.split()
-        if not words:
-            return title_lower
+        # Only the first word can be an article, so partition on the first
+        # space instead of tokenizing the whole title with split()
+        title_lower = title.casefold()
+        head, sep, rest = title_lower.lstrip().partition(' ')
         
-        first_word = words[0]
-        
-        # Check if first word is an article
-        if first_word in CatalogSorter.ARTICLES and len(words) > 1:
+        # Check if first word is an article (sep guards the single-word case)
+        if sep and head in CatalogSorter.ARTICLES:
             # Remove article and return rest
-            return ' '.join(words[1:])
+            return rest.lstrip().rstrip()
         
-        return title_lower
+        return title_lower.strip()
+    
+    @staticmethod
+    def _title_key(item: MediaItem) -> str:
+        """Returns the item's sort key, computing and caching it once.
+        
+        sorted() evaluates its key= function O(N log N) times; caching the
+        normalized title on the item keeps that work at one pass per item,
+        even across repeated sorts.
+        """
+        key = item._sort_key
+        if key is None:
+            key = CatalogSorter._get_sort_key(item.title)
+            item._sort_key = key
+        return key
     
     @staticmethod
     def sort_by_title(items: List[MediaItem]) -> List[MediaItem]:
         """Sorts by title (alphabetically), ignoring articles at the beginning"""
-        return sorted(items, key=lambda x: CatalogSorter._get_sort_key(x.title))
+        keyed = [(CatalogSorter._title_key(i), i) for i in items]
+        keyed.sort(key=lambda t: t[0])
+        return [i for _, i in keyed]
     
     @staticmethod
     def sort_by_year(items: List[MediaItem]) -> List[MediaItem]:
         """Sorts by year (newest first), alphabetically for same year"""
-        return sorted(items, 
-                     key=lambda x: (x.year or "0000", CatalogSorter._get_sort_key(x.title)), 
-                     reverse=True)
+        # Negating the year instead of reverse=True keeps titles A-Z within
+        # a year - reverse=True flipped the title order as well
+        keyed = [((-int(i.year) if i.year and i.year.isdigit() else 0,
+                   CatalogSorter._title_key(i)), i) for i in items]
+        keyed.sort(key=lambda t: t[0])
+        return [i for _, i in keyed]
     
     @staticmethod
     def sort_by_type(items: List[MediaItem]) -> List[MediaItem]:
         """Sorts by type (movies, then TV shows), then alphabetically"""
-        return sorted(items, 
-                     key=lambda x: (x.media_type, CatalogSorter._get_sort_key(x.title)))
+        keyed = [((i.media_type, CatalogSorter._title_key(i)), i) for i in items]
+        keyed.sort(key=lambda t: t[0])
+        return [i for _, i in keyed]
 
 
 def main():
@@ -493,7 +686,7 @@ def main():
     
     # Scan directory
     scanner = JellyfinScanner(args.path)
-    items = scanner.scan()
+    items = list(scanner.scan())
     
     if not items:
         print("No media found!")
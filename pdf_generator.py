@@ -2,6 +2,9 @@
 PDF Generator for Jellyfin Catalog
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 from typing import List
 from reportlab.lib import colors
@@ -10,16 +13,112 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import cm
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Image, 
-    PageBreak, Table, TableStyle, KeepTogether
+    PageBreak, Table, TableStyle, CondPageBreak, HRFlowable
 )
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from PIL import Image as PILImage
 import io
 
+# Characters with meaning in reportlab's XML-lite markup - one translate()
+# pass replaces three chained str.replace calls
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
+def _prepare_image_bytes(image_path, max_width: float, quality: int) -> tuple:
+    """Decodes, resizes and JPEG-encodes a poster; returns (bytes, w, h).
+
+    Module-level (not a method) so it pickles cleanly into worker
+    processes - image prep is pure CPU and parallelizes per file.
+    """
+    # Open with PIL
+    pil_img = PILImage.open(image_path)
+    
+    # Calculate target size maintaining aspect ratio
+    # max_width is already in reportlab points (1/72 inch)
+    aspect = pil_img.height / pil_img.width
+    target_width = max_width
+    target_height = target_width * aspect
+    
+    # Maximum height is dynamic: 1.5x the width (typical poster ratio)
+    # But no more than 9cm to fit on page
+    max_height = min(max_width * 1.5, 9 * cm)
+    if target_height > max_height:
+        target_height = max_height
+        target_width = target_height / aspect
+    
+    # Convert reportlab points to pixels for resizing
+    # We want reasonable resolution: use 150 DPI for good quality
+    dpi = 150
+    points_per_inch = 72
+    
+    # Calculate pixel dimensions
+    width_inches = target_width / points_per_inch
+    height_inches = target_height / points_per_inch
+    new_width_px = int(width_inches * dpi)
+    new_height_px = int(height_inches * dpi)
+    
+    # A JPEG that is already at (or within 10% of) the target resolution
+    # can go into the PDF as-is - reportlab embeds JPEG bytes directly,
+    # so the whole decode/resize/re-encode round trip is unnecessary
+    if (pil_img.format == 'JPEG' and pil_img.mode == 'RGB'
+            and abs(pil_img.width - new_width_px) <= new_width_px // 10
+            and abs(pil_img.height - new_height_px) <= new_height_px // 10):
+        with open(image_path, 'rb') as f:
+            return f.read(), target_width, target_height
+    
+    # libjpeg can downscale by 1/2, 1/4 or 1/8 during decode - ask for
+    # about twice the target and let the final resize polish the rest.
+    # No-op for non-JPEG sources, which keep their mode and size
+    pil_img.draft('RGB', (new_width_px * 2, new_height_px * 2))
+    
+    # Convert to RGB if necessary (removes alpha channel); drafted JPEGs
+    # already decode straight to RGB, so the common case skips all of this
+    if pil_img.mode != 'RGB':
+        if pil_img.mode == 'P':
+            pil_img = pil_img.convert('RGBA')
+        if pil_img.mode in ('RGBA', 'LA'):
+            alpha = pil_img.getchannel('A')
+            if alpha.getextrema()[0] == 255:
+                # Fully opaque - dropping the channel is enough, no need
+                # to allocate and paste onto a white background
+                pil_img = pil_img.convert('RGB')
+            else:
+                background = PILImage.new('RGB', pil_img.size, (255, 255, 255))
+                background.paste(pil_img, mask=alpha)
+                pil_img = background
+        else:
+            pil_img = pil_img.convert('RGB')
+    
+    # Only resize if image is larger (don't upscale)
+    if new_width_px < pil_img.width or new_height_px < pil_img.height:
+        pil_img_resized = pil_img.resize(
+            (new_width_px, new_height_px), 
+            PILImage.Resampling.LANCZOS,
+            reducing_gap=2.0
+        )
+    else:
+        # Image is already small enough, don't upscale
+        pil_img_resized = pil_img
+    
+    # Save to BytesIO with compression. optimize=True would run a second
+    # Huffman pass that roughly doubles encode time for a few hundred
+    # bytes saved on posters this small - not worth it
+    img_buffer = io.BytesIO()
+    pil_img_resized.save(
+        img_buffer, 
+        format='JPEG', 
+        quality=quality
+    )
+    
+    return img_buffer.getvalue(), target_width, target_height
+
 
 class PDFGenerator:
     """Creates PDF documents from media items"""
     
+    # Shared empty-cell sentinel for table padding
+    _EMPTY = ''
+    
     def __init__(self, output_path: str, image_quality: int = 75, 
                  poster_width_cm: float = 4.0, season_width_cm: float = 3.0):
         self.output_path = output_path
@@ -27,8 +126,12 @@ class PDFGenerator:
         self.poster_width_cm = poster_width_cm
         self.season_width_cm = season_width_cm
         
+        # Hand reportlab a file object with a 1 MiB buffer - its page
+        # streams otherwise go out as many small writes, which hurts on
+        # spinning disks and network mounts
+        self._out_fh = open(output_path, 'wb', buffering=1 << 20)
         self.doc = SimpleDocTemplate(
-            output_path,
+            self._out_fh,
             pagesize=A4,
             rightMargin=2*cm,
             leftMargin=2*cm,
@@ -38,6 +141,14 @@ class PDFGenerator:
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
         self.story = []
+        # Encoded posters keyed by _cache_key(), filled by the
+        # pre-encode pass in generate()
+        self._image_cache = {}
+        # Every file in the poster directories, indexed once per generate()
+        self._existing_paths = set()
+        # Paragraphs for text that repeats across items ("Movie - Year
+        # unknown", season labels, ...), keyed by (text, style name)
+        self._para_cache = {}
     
     def _setup_custom_styles(self):
         """Creates custom styles"""
@@ -79,9 +190,42 @@ class PDFGenerator:
             alignment=TA_LEFT,
             spaceAfter=20
         ))
+        
+        # Table styles are immutable w.r.t. the data they style - build
+        # them once instead of once per item
+        self._stats_tablestyle = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ])
+        self._content_tablestyle = TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+        ])
+        self._season_tablestyle = TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 5),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+            ('TOPPADDING', (0, 0), (-1, -1), 5),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+        ])
     
     def generate(self, items: List, sort_method: str = 'title'):
         """Generates the PDF document"""
+        # List each poster directory once instead of stat()ing every
+        # poster path - on network mounts those stats are the slow part
+        self._index_poster_files(items)
+        
+        # Encode all posters up front on a process pool - decode, resize
+        # and JPEG encode are pure CPU and embarrassingly parallel
+        self._preencode_images(items)
+        
         # Title page
         self._add_title_page(len(items), sort_method)
         
@@ -93,9 +237,112 @@ class PDFGenerator:
         
         # Create PDF
         print(f"\nCreating PDF: {self.output_path}")
-        self.doc.build(self.story)
+        # BaseDocTemplate.build consumes its flowable list destructively,
+        # popping each element once its page is rendered. Handing the story
+        # over and dropping our reference lets rendered flowables (and
+        # their image buffers) be collected while later pages are still
+        # being laid out, instead of pinning the whole catalog until the end
+        story = self.story
+        self.story = []
+        self._image_cache.clear()
+        self.doc.build(story)
+        self._out_fh.close()
         print(f"PDF successfully created!")
     
+    def _index_poster_files(self, items: List):
+        """Builds the set of files present in the poster directories"""
+        directories = set()
+        for item in items:
+            if item.poster_path:
+                directories.add(str(item.poster_path.parent))
+            if item.seasons:
+                for season in item.seasons:
+                    if season.poster_path:
+                        directories.add(str(season.poster_path.parent))
+        
+        existing = self._existing_paths
+        existing.clear()
+        for directory in directories:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        existing.add(entry.path)
+            except OSError:
+                continue
+    
+    def _poster_exists(self, path) -> bool:
+        """Membership check against the directory index - no stat call"""
+        return str(path) in self._existing_paths
+    
+    def _cached_para(self, text: str, style) -> Paragraph:
+        """Returns a shared Paragraph for recurring boilerplate text.
+
+        Paragraph construction parses the XML-lite markup every time;
+        short info lines recur constantly, and since all of them render
+        at the same column width the parsed object is safe to share.
+        """
+        key = (text, style.name)
+        para = self._para_cache.get(key)
+        if para is None:
+            para = Paragraph(text, style)
+            self._para_cache[key] = para
+        return para
+    
+    def _cache_key(self, image_path, max_width: float) -> tuple:
+        """Cache key for an encoded poster.
+
+        Resolving the path lets symlinked or re-used artwork (e.g. specials
+        sharing a season poster) hit the same entry; quality is part of the
+        key so entries never leak across settings.
+        """
+        try:
+            path = str(Path(image_path).resolve())
+        except OSError:
+            path = str(image_path)
+        return path, round(max_width, 2), self.image_quality
+    
+    def _preencode_images(self, items: List):
+        """Encodes every poster concurrently into the image cache"""
+        jobs = {}
+        poster_width = self.poster_width_cm * cm
+        season_width = self.season_width_cm * cm
+        for item in items:
+            if item.poster_path and self._poster_exists(item.poster_path):
+                key = self._cache_key(item.poster_path, poster_width)
+                jobs.setdefault(key, (str(item.poster_path), poster_width))
+            if item.seasons:
+                for season in item.seasons:
+                    if season.poster_path and self._poster_exists(season.poster_path):
+                        key = self._cache_key(season.poster_path, season_width)
+                        jobs.setdefault(key, (str(season.poster_path), season_width))
+        
+        if not jobs:
+            return
+        
+        # PIL releases the GIL inside libjpeg, so threads overlap decode
+        # and encode well - and for small batches a thread pool avoids the
+        # process pool's fork-and-pickle startup cost, which would exceed
+        # the encoding work itself
+        if len(jobs) < 32:
+            executor_cls = ThreadPoolExecutor
+            max_workers = min(4, len(jobs))
+        else:
+            executor_cls = ProcessPoolExecutor
+            max_workers = os.cpu_count()
+        
+        with executor_cls(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_prepare_image_bytes, path, width, self.image_quality): key
+                for key, (path, width) in jobs.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    self._image_cache[futures[future]] = future.result()
+                except Exception:
+                    # Leave the entry missing - _prepare_image falls back to
+                    # encoding inline and the callers' error handling applies
+                    pass
+    
     def _add_title_page(self, item_count: int, sort_method: str):
         """Adds title page"""
         self.story.append(Spacer(1, 3*cm))
@@ -119,16 +366,19 @@ class PDFGenerator:
     
     def _add_statistics(self, items: List):
         """Adds statistics page"""
-        # Count movies and TV shows
-        movies = sum(1 for item in items if item.media_type == 'movie')
-        shows = sum(1 for item in items if item.media_type == 'tvshow')
-        
-        # Year statistics
+        # Count movies, TV shows and years in one pass over the items
+        movies = shows = 0
         years = {}
+        years_get = years.get
         for item in items:
-            if item.year:
-                year = item.year
-                years[year] = years.get(year, 0) + 1
+            media_type = item.media_type
+            if media_type == 'movie':
+                movies += 1
+            elif media_type == 'tvshow':
+                shows += 1
+            year = item.year
+            if year:
+                years[year] = years_get(year, 0) + 1
         
         stats_title = Paragraph("Statistics", self.styles['Heading1'])
         self.story.append(stats_title)
@@ -143,16 +393,7 @@ class PDFGenerator:
         ]
         
         table = Table(data, colWidths=[8*cm, 4*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(self._stats_tablestyle)
         
         self.story.append(table)
         self.story.append(PageBreak())
@@ -163,16 +404,22 @@ class PDFGenerator:
         self.story.append(catalog_title)
         self.story.append(Spacer(1, 0.5*cm))
         
+        # Bind the styles once - the per-item stylesheet lookups add up
+        # over thousands of items
+        title_style = self.styles['MediaTitle']
+        info_style = self.styles['MediaInfo']
+        normal_style = self.styles['Normal']
+        
         for item in items:
-            self._add_media_item(item)
+            self._add_media_item(item, title_style, info_style, normal_style)
     
-    def _add_media_item(self, item):
+    def _add_media_item(self, item, title_style, info_style, normal_style):
         """Adds a single media item"""
         elements = []
         
         # Title without numbering
         title_text = item.title
-        title = Paragraph(title_text, self.styles['MediaTitle'])
+        title = Paragraph(title_text, title_style)
         elements.append(title)
         
         # Year and type
@@ -184,7 +431,7 @@ class PDFGenerator:
             total_episodes = sum(s.episode_count for s in item.seasons)
             info_text = f"<i>{type_name} • {item.year or 'Year unknown'} • {len(item.seasons)} seasons • {total_episodes} episodes</i>"
         
-        info = Paragraph(info_text, self.styles['MediaInfo'])
+        info = self._cached_para(info_text, info_style)
         elements.append(info)
         
         # Audio and subtitle information
@@ -200,20 +447,21 @@ class PDFGenerator:
                 tech_info_parts.append(f"<b>Subtitles:</b> {subtitle_str}")
             
             tech_info_text = " | ".join(tech_info_parts)
-            tech_info = Paragraph(tech_info_text, self.styles['MediaInfo'])
+            tech_info = self._cached_para(tech_info_text, info_style)
             elements.append(tech_info)
         
-        # Poster and description side by side
-        content_data = []
+        # Poster and description side by side. A tuple-of-tuples goes
+        # straight into Table() without list resize or GC tracking overhead
+        content_data = None
         
         # Poster (if available)
-        if item.poster_path and item.poster_path.exists():
+        if item.poster_path and self._poster_exists(item.poster_path):
             try:
                 img = self._prepare_image(item.poster_path, max_width=self.poster_width_cm*cm)
-                content_data.append([img, self._get_description(item.description)])
+                content_data = ((img, self._get_description(item.description)),)
             except Exception as e:
                 print(f"Error loading {item.poster_path}: {e}")
-                content_data.append(['', self._get_description(item.description)])
+                content_data = ((self._EMPTY, self._get_description(item.description)),)
         else:
             # Only description
             desc = self._get_description(item.description)
@@ -226,81 +474,69 @@ class PDFGenerator:
             text_col_width = (17 - self.poster_width_cm - 0.5) * cm  # Remaining width
             
             content_table = Table(content_data, colWidths=[poster_col_width, text_col_width])
-            content_table.setStyle(TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            ]))
+            content_table.setStyle(self._content_tablestyle)
             elements.append(content_table)
         
         # Season overview for TV shows
         if item.media_type == 'tvshow' and item.seasons:
             elements.append(Spacer(1, 0.3*cm))
-            self._add_season_overview(elements, item.seasons)
+            self._add_season_overview(elements, item.seasons, normal_style)
         
         elements.append(Spacer(1, 0.3*cm))
         
-        # Separator line
-        line_table = Table([['_' * 100]], colWidths=[17*cm])
-        line_table.setStyle(TableStyle([
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.lightgrey),
-            ('ALIGNMENT', (0, 0), (-1, -1), 'CENTER'),
-        ]))
-        elements.append(line_table)
+        # Separator line - a plain rule, much cheaper to lay out than the
+        # previous one-cell Table of underscores
+        elements.append(HRFlowable(width=17*cm, thickness=0.4,
+                                   color=colors.lightgrey,
+                                   spaceBefore=2, spaceAfter=2))
         elements.append(Spacer(1, 0.3*cm))
         
-        # Keep item together
-        self.story.append(KeepTogether(elements))
+        # Break to a fresh page only when the item's estimated height no
+        # longer fits. KeepTogether would find that out by trial-rendering
+        # the whole group twice; a height estimate is enough here since
+        # poster size bounds the layout
+        est_height = min(self.poster_width_cm * 1.5, 9) * cm + 4 * cm
+        if item.media_type == 'tvshow' and item.seasons:
+            season_rows = (len(item.seasons) + 2) // 3
+            est_height += season_rows * (self.season_width_cm * 1.5 + 2) * cm
+        # Never demand more than a page, or every tall item would get
+        # a page of its own
+        self.story.append(CondPageBreak(min(est_height, 23 * cm)))
+        self.story.extend(elements)
     
-    def _add_season_overview(self, elements: list, seasons: list):
+    def _add_season_overview(self, elements: list, seasons: list, normal_style):
         """Adds season overview with images"""
         # Heading
-        season_title = Paragraph("<b>Seasons:</b>", self.styles['Normal'])
+        season_title = self._cached_para("<b>Seasons:</b>", normal_style)
         elements.append(season_title)
         elements.append(Spacer(1, 0.2*cm))
         
-        # Create grid with seasons (3 per row)
+        # Create grid with seasons (3 per row), padding the last row with
+        # empty cells - slicing a prebuilt cell list beats per-element
+        # append/reset bookkeeping
         seasons_per_row = 3
-        season_rows = []
-        current_row = []
-        
-        for season in seasons:
-            # Create season cell
-            season_cell = self._create_season_cell(season)
-            current_row.append(season_cell)
-            
-            # New row when 3 seasons reached
-            if len(current_row) == seasons_per_row:
-                season_rows.append(current_row)
-                current_row = []
-        
-        # Add last incomplete row
-        if current_row:
-            # Fill with empty cells
-            while len(current_row) < seasons_per_row:
-                current_row.append('')
-            season_rows.append(current_row)
+        season_cells = [self._create_season_cell(s, normal_style) for s in seasons]
+        season_rows = [
+            season_cells[i:i + seasons_per_row]
+            for i in range(0, len(season_cells), seasons_per_row)
+        ]
+        if season_rows and len(season_rows[-1]) < seasons_per_row:
+            season_rows[-1].extend([self._EMPTY] * (seasons_per_row - len(season_rows[-1])))
         
         # Create table
         if season_rows:
             # Calculate column width based on season poster size
             col_width = (self.season_width_cm + 2.5) * cm  # Add margin for text
             season_table = Table(season_rows, colWidths=[col_width] * seasons_per_row)
-            season_table.setStyle(TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 5),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-                ('TOPPADDING', (0, 0), (-1, -1), 5),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ]))
+            season_table.setStyle(self._season_tablestyle)
             elements.append(season_table)
     
-    def _create_season_cell(self, season) -> list:
+    def _create_season_cell(self, season, normal_style) -> list:
         """Creates a cell for a season with image and info"""
         cell_elements = []
         
         # Season poster (small)
-        if season.poster_path and season.poster_path.exists():
+        if season.poster_path and self._poster_exists(season.poster_path):
             try:
                 img = self._prepare_image(season.poster_path, max_width=self.season_width_cm*cm)
                 cell_elements.append(img)
@@ -309,87 +545,34 @@ class PDFGenerator:
         
         # Season info
         season_text = f"<b>Season {season.season_number}</b><br/><i>{season.episode_count} episodes</i>"
-        season_para = Paragraph(season_text, self.styles['Normal'])
+        season_para = self._cached_para(season_text, normal_style)
         cell_elements.append(season_para)
         
         return cell_elements
     
     def _prepare_image(self, image_path: Path, max_width: float = 4*cm) -> Image:
-        """Prepares and optimizes image for PDF"""
-        from io import BytesIO
-        
-        # Open with PIL
-        pil_img = PILImage.open(image_path)
-        
-        # Convert to RGB if necessary (removes alpha channel)
-        if pil_img.mode in ('RGBA', 'LA', 'P'):
-            background = PILImage.new('RGB', pil_img.size, (255, 255, 255))
-            if pil_img.mode == 'P':
-                pil_img = pil_img.convert('RGBA')
-            background.paste(pil_img, mask=pil_img.split()[-1] if pil_img.mode in ('RGBA', 'LA') else None)
-            pil_img = background
-        elif pil_img.mode != 'RGB':
-            pil_img = pil_img.convert('RGB')
-        
-        # Calculate target size maintaining aspect ratio
-        # max_width is already in reportlab points (1/72 inch)
-        aspect = pil_img.height / pil_img.width
-        target_width = max_width
-        target_height = target_width * aspect
-        
-        # Maximum height is dynamic: 1.5x the width (typical poster ratio)
-        # But no more than 9cm to fit on page
-        max_height = min(max_width * 1.5, 9 * cm)
-        if target_height > max_height:
-            target_height = max_height
-            target_width = target_height / aspect
-        
-        # Convert reportlab points to pixels for resizing
-        # We want reasonable resolution: use 150 DPI for good quality
-        dpi = 150
-        points_per_inch = 72
-        
-        # Calculate pixel dimensions
-        width_inches = target_width / points_per_inch
-        height_inches = target_height / points_per_inch
-        new_width_px = int(width_inches * dpi)
-        new_height_px = int(height_inches * dpi)
-        
-        # Only resize if image is larger (don't upscale)
-        if new_width_px < pil_img.width or new_height_px < pil_img.height:
-            pil_img_resized = pil_img.resize(
-                (new_width_px, new_height_px), 
-                PILImage.Resampling.LANCZOS
-            )
-        else:
-            # Image is already small enough, don't upscale
-            pil_img_resized = pil_img
-        
-        # Save to BytesIO with compression
-        img_buffer = BytesIO()
-        pil_img_resized.save(
-            img_buffer, 
-            format='JPEG', 
-            quality=self.image_quality,
-            optimize=True
-        )
-        img_buffer.seek(0)
+        """Returns a reportlab Image for a poster, using pre-encoded bytes"""
+        key = self._cache_key(image_path, max_width)
+        cached = self._image_cache.get(key)
+        if cached is None:
+            # Not pre-encoded (new path or the worker failed) - do it here
+            cached = _prepare_image_bytes(image_path, max_width, self.image_quality)
+            self._image_cache[key] = cached
+        data, target_width, target_height = cached
         
         # Create reportlab Image with the correct display size
-        img = Image(img_buffer, width=target_width, height=target_height)
-        return img
+        return Image(io.BytesIO(data), width=target_width, height=target_height)
     
     def _get_description(self, description: str) -> Paragraph:
         """Creates description paragraph"""
         if not description:
-            desc_text = "<i>No description available</i>"
+            return self._cached_para("<i>No description available</i>",
+                                     self.styles['Description'])
         else:
-            # Limit length and clean text
-            desc_text = description[:500]
+            # Limit length and escape markup characters in one C-level pass
+            desc_text = description[:500].translate(_HTML_ESCAPE)
             if len(description) > 500:
                 desc_text += "..."
-            # Escape HTML characters
-            desc_text = desc_text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
         
         return Paragraph(desc_text, self.styles['Description'])
     
@@ -404,5 +587,4 @@ class PDFGenerator:
     
     def _get_current_date(self) -> str:
         """Returns current date"""
-        from datetime import datetime
         return datetime.now().strftime('%Y-%m-%d')